@@ -6,6 +6,7 @@ import matplotlib as _mpl
 import matplotlib.pyplot as _plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable as _make_axes_locatable
 import copy as _copy
+import functools as _functools
 import warnings as _warnings
 from scipy.special import factorial as _factorial
 import xarray as _xr
@@ -30,6 +31,82 @@ try:
 except ModuleNotFoundError:
     _pygmt_module = False
 
+# Integer flags used by the Fortran routines for each normalization
+_expand_norms = {'4pi': 1, 'schmidt': 2, 'unnorm': 3, 'ortho': 4}
+
+
+@_functools.lru_cache(maxsize=64)
+def _glq_nodes_weights(lmax):
+    """
+    Return the Gauss-Legendre Quadrature nodes and weights for degree lmax.
+
+    The arrays are cached and shared by all GLQ grids of the same lmax, and
+    are therefore marked as read-only.
+    """
+    zeros, weights = _shtools.SHGLQ(lmax)
+    zeros.flags.writeable = False
+    weights.flags.writeable = False
+    return zeros, weights
+
+
+@_functools.lru_cache(maxsize=64)
+def _glq_lats(lmax):
+    """Return the cached latitudes (in degrees) of a GLQ grid."""
+    zeros, weights = _glq_nodes_weights(lmax)
+    lats = _np.arcsin(zeros)
+    _np.rad2deg(lats, out=lats)
+    lats.flags.writeable = False
+    return lats
+
+
+@_functools.lru_cache(maxsize=64)
+def _dh_lats(nlat, extend):
+    """Return the cached latitudes (in degrees) of a DH grid."""
+    if extend:
+        lats = _np.linspace(90.0, -90.0, num=nlat)
+    else:
+        lats = _np.linspace(90.0, -90.0 + 180.0 / nlat, num=nlat)
+    lats.flags.writeable = False
+    return lats
+
+
+@_functools.lru_cache(maxsize=64)
+def _grid_lons(nlon, extend):
+    """Return the cached longitudes (in degrees) of a DH or GLQ grid."""
+    if extend:
+        lons = _np.arange(nlon) * (360.0 / (nlon - 1))
+        lons[-1] = 360.0
+    else:
+        lons = _np.arange(nlon) * (360.0 / nlon)
+    lons.flags.writeable = False
+    return lons
+
+
+def _read_only(array):
+    """Return a read-only view of array that can be shared between grids."""
+    array = _np.asarray(array)
+    if array.flags.writeable:
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+def _imshow_data(data, vmin, vmax):
+    """
+    Return the gridded data to be plotted with imshow(). The data are
+    converted to single precision, which halves the size of the image buffers
+    used by matplotlib, unless this would degrade the resolution of the
+    colormap between vmin and vmax. Integer and boolean data are returned
+    unchanged.
+    """
+    if not _np.issubdtype(_np.asarray(data).dtype, _np.floating):
+        return data
+    vmin, vmax = float(vmin), float(vmax)
+    span = abs(vmax - vmin)
+    if span > 0 and max(abs(vmin), abs(vmax)) < 1.e3 * span:
+        return _np.asarray(data, dtype=_np.float32)
+    return data
+
 
 # =============================================================================
 # =========    COEFFICIENT CLASSES    =========================================
@@ -2483,15 +2560,9 @@ class SHRealCoeffs(SHCoeffs):
 
     def _expandDH(self, sampling, lmax, lmax_calc, extend):
         """Evaluate the coefficients on a Driscoll and Healy (1994) grid."""
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
@@ -2505,22 +2576,16 @@ class SHRealCoeffs(SHCoeffs):
 
     def _expandGLQ(self, zeros, lmax, lmax_calc, extend):
         """Evaluate the coefficients on a Gauss Legendre quadrature grid."""
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
                 .format(repr(self.normalization)))
 
         if zeros is None:
-            zeros, weights = _shtools.SHGLQ(self.lmax)
+            zeros, weights = _glq_nodes_weights(self.lmax)
 
         data = _shtools.MakeGridGLQ(self.coeffs, zeros, norm=norm,
                                     csphase=self.csphase, lmax=lmax,
@@ -2530,15 +2595,9 @@ class SHRealCoeffs(SHCoeffs):
 
     def _expand_coord(self, lat, lon, lmax_calc, degrees):
         """Evaluate the function at the coordinates lat and lon."""
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
@@ -2686,15 +2745,9 @@ class SHComplexCoeffs(SHCoeffs):
                                         sampling=1, csphase=1)
         grid_rot = rgrid_rot + 1j * igrid_rot
 
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
@@ -2709,15 +2762,9 @@ class SHComplexCoeffs(SHCoeffs):
 
     def _expandDH(self, sampling, lmax, lmax_calc, extend):
         """Evaluate the coefficients on a Driscoll and Healy (1994) grid."""
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
@@ -2731,22 +2778,16 @@ class SHComplexCoeffs(SHCoeffs):
 
     def _expandGLQ(self, zeros, lmax, lmax_calc, extend):
         """Evaluate the coefficients on a Gauss-Legendre quadrature grid."""
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
                 .format(repr(self.normalization)))
 
         if zeros is None:
-            zeros, weights = _shtools.SHGLQ(self.lmax)
+            zeros, weights = _glq_nodes_weights(self.lmax)
 
         data = _shtools.MakeGridGLQC(self.coeffs, zeros, norm=norm,
                                      csphase=self.csphase, lmax=lmax,
@@ -2756,15 +2797,9 @@ class SHComplexCoeffs(SHCoeffs):
 
     def _expand_coord(self, lat, lon, lmax_calc, degrees):
         """Evaluate the function at the coordinates lat and lon."""
-        if self.normalization == '4pi':
-            norm = 1
-        elif self.normalization == 'schmidt':
-            norm = 2
-        elif self.normalization == 'unnorm':
-            norm = 3
-        elif self.normalization == 'ortho':
-            norm = 4
-        else:
+        try:
+            norm = _expand_norms[self.normalization]
+        except KeyError:
             raise ValueError(
                 "Normalization must be '4pi', 'ortho', 'schmidt', or " +
                 "'unnorm'. Input value is {:s}."
@@ -2871,6 +2906,8 @@ class SHGrid(object):
     plot3d()    : Plot the raw data on a 3d sphere.
     info()      : Print a summary of the data stored in the SHGrid instance.
     """
+    # Default plot annotations
+    _complex_titles = ('Real component', 'Imaginary component')
 
     def __init__():
         """Unused constructor of the super class."""
@@ -2884,13 +2921,13 @@ class SHGrid(object):
 
     # ---- Factory methods ----
     @classmethod
-    def from_array(self, array, grid='DH', copy=True):
+    def from_array(self, array, grid='DH', copy=True, dtype=None):
         """
         Initialize the class instance from an input array.
 
         Usage
         -----
-        x = SHGrid.from_array(array, [grid, copy])
+        x = SHGrid.from_array(array, [grid, copy, dtype])
 
         Returns
         -------
@@ -2908,8 +2945,23 @@ class SHGrid(object):
             If True (default), make a copy of array when initializing the class
             instance. If False, initialize the class instance with a reference
             to array.
-        """
-        if _np.iscomplexobj(array):
+        dtype : data-type, optional, default = None
+            The data type used to store the gridded data. If None, the data
+            type of array is used. Single precision (numpy.float32 or
+            numpy.complex64) halves the memory used by the grid and is
+            sufficient for plotting, whereas expand() always computes in
+            double precision. A real dtype cannot be used with a complex
+            array.
+        """
+        if dtype is None:
+            iscomplex = _np.iscomplexobj(array)
+        else:
+            iscomplex = _np.issubdtype(dtype, _np.complexfloating)
+            if _np.iscomplexobj(array) and not iscomplex:
+                raise ValueError('dtype must be a complex type when array '
+                                 'is complex. Input dtype is {:s}.'
+                                 .format(str(_np.dtype(dtype))))
+        if iscomplex:
             kind = 'complex'
         else:
             kind = 'real'
@@ -2926,17 +2978,17 @@ class SHGrid(object):
 
         for cls in self.__subclasses__():
             if cls.istype(kind) and cls.isgrid(grid):
-                return cls(array, copy=copy)
+                return cls(array, copy=copy, dtype=dtype)
 
     @classmethod
     def from_zeros(self, lmax, grid='DH', kind='real', sampling=2,
-                   extend=True):
+                   extend=True, dtype=None):
         """
         Initialize the class instance using an array of zeros.
 
         Usage
         -----
-        x = SHGrid.from_zeros(lmax, [grid, kind, sampling, extend])
+        x = SHGrid.from_zeros(lmax, [grid, kind, sampling, extend, dtype])
 
         Returns
         -------
@@ -2959,6 +3011,11 @@ class SHGrid(object):
         extend : bool, optional, default = True
             If True, include the longitudinal band for 360 E (DH and GLQ grids)
             and the latitudinal band for 90 S (DH grids only).
+        dtype : data-type, optional, default = None
+            The data type used to store the gridded data, such as
+            numpy.float32 or numpy.complex64. If None, double precision real
+            or complex numbers are used, depending on kind. Otherwise, it must
+            be a complex type if and only if kind is 'complex'.
         """
         if type(grid) != str:
             raise ValueError('grid must be a string. Input type is {:s}.'
@@ -2983,10 +3040,17 @@ class SHGrid(object):
             if extend:
                 nlon += 1
 
-        if kind == 'real':
-            array = _np.zeros((nlat, nlon), dtype=_np.float_)
-        else:
-            array = _np.zeros((nlat, nlon), dtype=_np.complex_)
+        if dtype is None:
+            if kind == 'real':
+                dtype = _np.float_
+            else:
+                dtype = _np.complex_
+        elif _np.issubdtype(dtype, _np.complexfloating) != (kind == 'complex'):
+            raise ValueError('dtype must be a complex type when kind is ' +
+                             "'complex' and a real type otherwise. " +
+                             'Input values are kind = {:s} and dtype = {:s}.'
+                             .format(repr(kind), str(_np.dtype(dtype))))
+        array = _np.zeros((nlat, nlon), dtype=dtype)
 
         for cls in self.__subclasses__():
             if cls.istype(kind) and cls.isgrid(grid):
@@ -2994,7 +3058,7 @@ class SHGrid(object):
 
     @classmethod
     def from_cap(self, theta, clat, clon, lmax, grid='DH', kind='real',
-                 sampling=2, degrees=True, extend=True):
+                 sampling=2, degrees=True, extend=True, dtype=None):
         """
         Initialize the class instance with an array equal to unity within
         a spherical cap and zero elsewhere.
@@ -3002,7 +3066,7 @@ class SHGrid(object):
         Usage
         -----
         x = SHGrid.from_cap(theta, clat, clon, lmax, [grid, kind, sampling,
-                            degrees, extend])
+                            degrees, extend, dtype])
 
         Returns
         -------
@@ -3032,9 +3096,14 @@ class SHGrid(object):
         extend : bool, optional, default = True
             If True, include the longitudinal band for 360 E (DH and GLQ grids)
             and the latitudinal band for 90 S (DH grids only).
+        dtype : data-type, optional, default = None
+            The data type used to store the gridded data. If None, double
+            precision real or complex numbers are used, depending on kind.
+            Otherwise, it must be a complex type if and only if kind is
+            'complex'.
         """
         temp = self.from_zeros(lmax, grid=grid, kind=kind, sampling=sampling,
-                               extend=extend)
+                               extend=extend, dtype=dtype)
 
         if degrees is True:
             theta = _np.deg2rad(theta)
@@ -3071,13 +3140,14 @@ class SHGrid(object):
         return temp
 
     @classmethod
-    def from_file(self, fname, binary=False, grid='DH', **kwargs):
+    def from_file(self, fname, binary=False, grid='DH', dtype=None,
+                  **kwargs):
         """
         Initialize the class instance from gridded data in a file.
 
         Usage
         -----
-        x = SHGrid.from_file(fname, [binary, grid, **kwargs])
+        x = SHGrid.from_file(fname, [binary, grid, dtype, **kwargs])
 
         Returns
         -------
@@ -3097,18 +3167,24 @@ class SHGrid(object):
         grid : str, optional, default = 'DH'
             'DH' or 'GLQ' for Driscoll and Healy grids or Gauss-Legendre
             Quadrature grids, respectively.
+        dtype : data-type, optional, default = None
+            The data type used to store the gridded data. If None, the data
+            type of the file is used (double precision for text files).
         **kwargs : keyword arguments, optional
             Keyword arguments of numpy.loadtxt() or numpy.load().
         """
         if binary is False:
+            if dtype is not None:
+                kwargs['dtype'] = dtype
             data = _np.loadtxt(fname, **kwargs)
         elif binary is True:
+            kwargs.setdefault('allow_pickle', False)
             data = _np.load(fname, **kwargs)
         else:
             raise ValueError('binary must be True or False. '
                              'Input value is {:s}.'.format(binary))
 
-        return self.from_array(data, grid=grid, copy=False)
+        return self.from_array(data, grid=grid, copy=False, dtype=dtype)
 
     @classmethod
     def from_xarray(self, data_array, grid='DH'):
@@ -3158,17 +3234,25 @@ class SHGrid(object):
             Quadrature grids, respectively.
         """
         data_array = _xr.open_dataarray(netcdf)
-        return self.from_array(data_array.values, grid=grid)
+        return self.from_array(data_array.values, grid=grid, copy=False)
 
     def copy(self):
         """
-        Return a deep copy of the class instance.
+        Return a copy of the class instance.
 
         Usage
         -----
         copy = x.copy()
+
+        Notes
+        -----
+        The gridded data are copied, whereas the read-only Gauss-Legendre
+        Quadrature nodes and weights are shared with the original instance.
         """
-        return _copy.deepcopy(self)
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.data = _np.array(self.data, order='C')
+        return new
 
     def to_file(self, filename, binary=False, **kwargs):
         """
@@ -3193,6 +3277,7 @@ class SHGrid(object):
         if binary is False:
             _np.savetxt(filename, self.data, **kwargs)
         elif binary is True:
+            kwargs.setdefault('allow_pickle', False)
             _np.save(filename, self.data, **kwargs)
         else:
             raise ValueError('binary must be True or False. '
@@ -3239,17 +3324,17 @@ class SHGrid(object):
         if units is not None:
             attrs['units'] = units
 
+        lats = self.lats()
+        lons = self.lons()
         return _xr.DataArray(self.to_array(),
-                             coords=[('lat', self.lats(),
+                             coords=[('lat', lats,
                                       {'long_name': 'latitude',
                                        'units': 'degrees_north',
-                                       'actual_range': [self.lats()[0],
-                                                        self.lats()[-1]]}),
-                                     ('lon', self.lons(),
+                                       'actual_range': [lats[0], lats[-1]]}),
+                                     ('lon', lons,
                                       {'long_name': 'longitude',
                                        'units': 'degrees_east',
-                                       'actual_range': [self.lons()[0],
-                                                        self.lons()[-1]]})],
+                                       'actual_range': [lons[0], lons[-1]]})],
                              attrs=attrs)
 
     def to_netcdf(self, filename=None, title=None, description=None,
@@ -3381,7 +3466,7 @@ class SHGrid(object):
             if (self.grid == other.grid and self.data.shape ==
                     other.data.shape and self.kind == other.kind):
                 data = self.data + other.data
-                return SHGrid.from_array(data, grid=self.grid)
+                return SHGrid.from_array(data, grid=self.grid, copy=False)
             else:
                 raise ValueError('The two grids must be of the '
                                  'same kind and have the same shape.')
@@ -3390,7 +3475,7 @@ class SHGrid(object):
                 raise ValueError('Can not add a complex constant to a '
                                  'real grid.')
             data = self.data + other
-            return SHGrid.from_array(data, grid=self.grid)
+            return SHGrid.from_array(data, grid=self.grid, copy=False)
         else:
             raise NotImplementedError('Mathematical operator not implemented '
                                       'for these operands.')
@@ -3405,7 +3490,7 @@ class SHGrid(object):
             if (self.grid == other.grid and self.data.shape ==
                     other.data.shape and self.kind == other.kind):
                 data = self.data - other.data
-                return SHGrid.from_array(data, grid=self.grid)
+                return SHGrid.from_array(data, grid=self.grid, copy=False)
             else:
                 raise ValueError('The two grids must be of the '
                                  'same kind and have the same shape.')
@@ -3414,7 +3499,7 @@ class SHGrid(object):
                 raise ValueError('Can not subtract a complex constant from '
                                  'a real grid.')
             data = self.data - other
-            return SHGrid.from_array(data, grid=self.grid)
+            return SHGrid.from_array(data, grid=self.grid, copy=False)
         else:
             raise NotImplementedError('Mathematical operator not implemented '
                                       'for these operands.')
@@ -3425,7 +3510,7 @@ class SHGrid(object):
             if (self.grid == other.grid and self.data.shape ==
                     other.data.shape and self.kind == other.kind):
                 data = other.data - self.data
-                return SHGrid.from_array(data, grid=self.grid)
+                return SHGrid.from_array(data, grid=self.grid, copy=False)
             else:
                 raise ValueError('The two grids must be of the '
                                  'same kind and have the same shape.')
@@ -3434,7 +3519,7 @@ class SHGrid(object):
                 raise ValueError('Can not subtract a complex constant from '
                                  'a real grid.')
             data = other - self.data
-            return SHGrid.from_array(data, grid=self.grid)
+            return SHGrid.from_array(data, grid=self.grid, copy=False)
         else:
             raise NotImplementedError('Mathematical operator not implemented '
                                       'for these operands.')
@@ -3445,7 +3530,7 @@ class SHGrid(object):
             if (self.grid == other.grid and self.data.shape ==
                     other.data.shape and self.kind == other.kind):
                 data = self.data * other.data
-                return SHGrid.from_array(data, grid=self.grid)
+                return SHGrid.from_array(data, grid=self.grid, copy=False)
             else:
                 raise ValueError('The two grids must be of the '
                                  'same kind and have the same shape.')
@@ -3454,7 +3539,7 @@ class SHGrid(object):
                 raise ValueError('Can not multiply a real grid by a complex '
                                  'constant.')
             data = self.data * other
-            return SHGrid.from_array(data, grid=self.grid)
+            return SHGrid.from_array(data, grid=self.grid, copy=False)
         else:
             raise NotImplementedError('Mathematical operator not implemented '
                                       'for these operands.')
@@ -3471,7 +3556,7 @@ class SHGrid(object):
             if (self.grid == other.grid and self.data.shape ==
                     other.data.shape and self.kind == other.kind):
                 data = self.data / other.data
-                return SHGrid.from_array(data, grid=self.grid)
+                return SHGrid.from_array(data, grid=self.grid, copy=False)
             else:
                 raise ValueError('The two grids must be of the '
                                  'same kind and have the same shape.')
@@ -3480,7 +3565,7 @@ class SHGrid(object):
                 raise ValueError('Can not divide a real grid by a complex '
                                  'constant.')
             data = self.data / other
-            return SHGrid.from_array(data, grid=self.grid)
+            return SHGrid.from_array(data, grid=self.grid, copy=False)
         else:
             raise NotImplementedError('Mathematical operator not implemented '
                                       'for these operands.')
@@ -3488,14 +3573,15 @@ class SHGrid(object):
     def __pow__(self, other):
         """Raise a grid to a scalar power: pow(self, other)."""
         if _np.isscalar(other) is True:
-            return SHGrid.from_array(pow(self.data, other), grid=self.grid)
+            return SHGrid.from_array(pow(self.data, other), grid=self.grid,
+                                     copy=False)
         else:
             raise NotImplementedError('Mathematical operator not implemented '
                                       'for these operands.')
 
     def __abs__(self):
         """Return the absolute value of the gridded data."""
-        return SHGrid.from_array(abs(self.data), grid=self.grid)
+        return SHGrid.from_array(abs(self.data), grid=self.grid, copy=False)
 
     def __repr__(self):
         str = ('kind = {:s}\n'
@@ -3534,7 +3620,7 @@ class SHGrid(object):
         if degrees is False:
             return _np.radians(self._lats())
         else:
-            return self._lats()
+            return _np.copy(self._lats())
 
     def lons(self, degrees=True):
         """
@@ -3559,7 +3645,7 @@ class SHGrid(object):
         if degrees is False:
             return _np.radians(self._lons())
         else:
-            return self._lons()
+            return _np.copy(self._lons())
 
     # ---- Plotting routines ----
     def plot3d(self, elevation=20, azimuth=30, cmap='RdBu_r', show=True,
@@ -3627,37 +3713,53 @@ class SHGrid(object):
         points = _np.vstack((x.flatten(), y.flatten(), z.flatten()))
 
         # fill data for all points. 0 lon has to be repeated (circular mesh)
-        # and the south pole has to be added in the DH grid
+        # and the south pole has to be added in the DH grid. Single-precision
+        # grids are kept in single precision, while integer and boolean grids
+        # are promoted to a floating type for the averages below.
+        work_dtype = _np.result_type(data.dtype, _np.float32)
         if self.grid == 'DH':
-            magn_point = _np.zeros((nlat + 1, nlon + 1))
+            magn_point = _np.zeros((nlat + 1, nlon + 1), dtype=work_dtype)
             magn_point[:-1, :-1] = data
             magn_point[-1, :] = _np.mean(data[-1])  # not exact !
             magn_point[:-1, -1] = data[:, 0]
         if self.grid == 'GLQ':
-            magn_point = _np.zeros((nlat + 2, nlon + 1))
+            magn_point = _np.zeros((nlat + 2, nlon + 1), dtype=work_dtype)
             magn_point[1:-1, :-1] = data
             magn_point[0, :] = _np.mean(data[0])  # not exact !
             magn_point[-1, :] = _np.mean(data[-1])  # not exact !
             magn_point[1:-1, -1] = data[:, 0]
 
-        # compute face color, which is the average of all neighbour points
-        magn_face = 1./4. * (magn_point[1:, 1:] + magn_point[:-1, 1:] +
-                             magn_point[1:, :-1] + magn_point[:-1, :-1])
+        # compute face color, which is the average of all neighbour points.
+        # The sum is accumulated in blocks of rows that fit in cache so that
+        # the four shifted reads of each block are not evicted between sums.
+        nrows, ncols = magn_point.shape[0] - 1, magn_point.shape[1] - 1
+        magn_face = _np.empty((nrows, ncols), dtype=magn_point.dtype)
+        block = max(1, 2**18 // (magn_point.itemsize * magn_point.shape[1]))
+        for i0 in range(0, nrows, block):
+            i1 = min(i0 + block, nrows)
+            face = magn_face[i0:i1]
+            _np.add(magn_point[i0+1:i1+1, 1:], magn_point[i0:i1, 1:],
+                    out=face)
+            face += magn_point[i0+1:i1+1, :-1]
+            face += magn_point[i0:i1, :-1]
+            face *= 1./4.
 
         magnmax_face = _np.max(_np.abs(magn_face))
         magnmax_point = _np.max(_np.abs(magn_point))
 
         # compute colours and displace the points
         norm = _plt.Normalize(-magnmax_face / 2., magnmax_face / 2., clip=True)
-        colors = cmap(norm(magn_face.flatten()))
+        colors = cmap(norm(magn_face.ravel()))
         colors = colors.reshape(nlats_circular - 1, nlons_circular - 1, 4)
-        points *= (1. + magn_point.flatten() / magnmax_point / 2.)
+        scale = magn_point.ravel() / (2. * magnmax_point)
+        scale += 1.
+        points *= scale
         x = points[0].reshape(sshape)
         y = points[1].reshape(sshape)
         z = points[2].reshape(sshape)
 
         # plot 3d radiation pattern
-        fig = _plt.figure()
+        fig = _plt.figure(constrained_layout=True)
         ax3d = fig.add_subplot(1, 1, 1, projection='3d')
 
         ax3d.plot_surface(x, y, z, rstride=1, cstride=1, facecolors=colors)
@@ -3667,7 +3769,6 @@ class SHGrid(object):
         ax3d.view_init(elev=elevation, azim=azimuth)
 
         # show or save output
-        fig.tight_layout(pad=0.5)
         if show:
             fig.show()
 
@@ -3684,7 +3785,7 @@ class SHGrid(object):
              cb_tick_interval=None, cb_minor_tick_interval=None,
              cb_offset=None, cb_width=None, grid=False, axes_labelsize=None,
              tick_labelsize=None, xlabel=True, ylabel=True, ax=None, ax2=None,
-             show=True, fname=None):
+             interpolation='nearest', show=True, fname=None):
         """
         Plot the data using a Cartopy projection or a matplotlib cylindrical
         projection.
@@ -3697,7 +3798,7 @@ class SHGrid(object):
                           cb_triangles, cb_label, cb_ylabel, cb_tick_interval,
                           cb_minor_tick_interval, cb_offset, cb_width, grid,
                           titlesize, axes_labelsize, tick_labelsize, ax, ax2,
-                          show, fname])
+                          interpolation, show, fname])
 
         Parameters
         ----------
@@ -3773,6 +3874,11 @@ class SHGrid(object):
             A single matplotlib axes object where the plot will appear. If the
             grid is complex, the complex component of the grid will be plotted
             on this axes.
+        interpolation : str, optional, default = 'nearest'
+            The interpolation method passed to matplotlib's imshow() when no
+            projection is used. The default draws each grid cell as a uniform
+            block. When the image is downsampled, as for high-degree grids,
+            use 'antialiased' to avoid aliasing artifacts.
         show : bool, optional, default = True
             If True, plot the image to the screen.
         fname : str, optional, default = None
@@ -3806,17 +3912,11 @@ class SHGrid(object):
         if titlesize is None:
             titlesize = _mpl.rcParams['axes.titlesize']
         if self.kind == 'complex' and title is None:
-            title = ['Real component', 'Imaginary component']
+            title = self._complex_titles
         if xlabel is True:
-            if self.grid == 'DH':
-                xlabel = 'Longitude'
-            else:
-                xlabel = 'GLQ longitude index'
+            xlabel = self._xlabel
         if ylabel is True:
-            if self.grid == 'DH':
-                ylabel = 'Latitude'
-            else:
-                ylabel = 'GLQ latitude index'
+            ylabel = self._ylabel
         if colorbar is not None:
             if colorbar not in set(['top', 'bottom', 'left', 'right']):
                 raise ValueError("colorbar must be 'top', 'bottom', 'left' or "
@@ -3835,7 +3935,7 @@ class SHGrid(object):
                 cb_minor_tick_interval=cb_minor_tick_interval, cmap=cmap,
                 cmap_limits=cmap_limits, cb_offset=cb_offset,
                 cb_width=cb_width, cmap_limits_complex=cmap_limits_complex,
-                cmap_reverse=cmap_reverse)
+                cmap_reverse=cmap_reverse, interpolation=interpolation)
         else:
             if self.kind == 'complex':
                 if (ax is None and ax2 is not None) or (ax2 is None and
@@ -3856,7 +3956,7 @@ class SHGrid(object):
                        cmap_limits=cmap_limits, cb_ylabel=cb_ylabel,
                        cb_width=cb_width,
                        cmap_limits_complex=cmap_limits_complex,
-                       cmap_reverse=cmap_reverse)
+                       cmap_reverse=cmap_reverse, interpolation=interpolation)
 
         if ax is None:
             fig.tight_layout(pad=0.5)
@@ -4011,7 +4111,7 @@ class SHGrid(object):
         if minor_tick_interval is None:
             minor_tick_interval = [None, None]
         if self.kind == 'complex' and title is None:
-            title = ['Real component', 'Imaginary component']
+            title = self._complex_titles
         if grid is True:
             grid = tick_interval
         if width is None:
@@ -4108,6 +4208,8 @@ class SHGrid(object):
 
 class DHRealGrid(SHGrid):
     """Class for real Driscoll and Healy (1994) grids."""
+    _xlabel = 'Longitude'
+    _ylabel = 'Latitude'
 
     @staticmethod
     def istype(kind):
@@ -4117,7 +4219,7 @@ class DHRealGrid(SHGrid):
     def isgrid(grid):
         return grid == 'DH'
 
-    def __init__(self, array, copy=True):
+    def __init__(self, array, copy=True, dtype=None):
         self.nlat, self.nlon = array.shape
 
         if self.nlat % 2 != 0:
@@ -4143,37 +4245,24 @@ class DHRealGrid(SHGrid):
         self.kind = 'real'
 
         if copy:
-            self.data = _np.copy(array)
+            self.data = _np.array(array, dtype=dtype)
         else:
-            self.data = array
+            self.data = _np.asarray(array, dtype=dtype)
 
     def _lats(self):
         """Return the latitudes (in degrees) of the gridded data."""
-        if self.extend:
-            lats = _np.linspace(90.0, -90.0, num=self.nlat)
-        else:
-            lats = _np.linspace(90.0, -90.0 + 180.0 / self.nlat, num=self.nlat)
-        return lats
+        return _dh_lats(self.nlat, self.extend)
 
     def _lons(self):
         """Return the longitudes (in degrees) of the gridded data."""
-        if self.extend:
-            lons = _np.linspace(0.0, 360.0, num=self.nlon)
-        else:
-            lons = _np.linspace(0.0, 360.0 - 360.0 / self.nlon, num=self.nlon)
-        return lons
+        return _grid_lons(self.nlon, self.extend)
 
     def _expand(self, normalization, csphase, **kwargs):
         """Expand the grid into real spherical harmonics."""
-        if normalization.lower() == '4pi':
-            norm = 1
-        elif normalization.lower() == 'schmidt':
-            norm = 2
-        elif normalization.lower() == 'unnorm':
-            norm = 3
-        elif normalization.lower() == 'ortho':
-            norm = 4
-        else:
+        normalization = normalization.lower()
+        try:
+            norm = _expand_norms[normalization]
+        except KeyError:
             raise ValueError(
                 "The normalization must be '4pi', 'ortho', 'schmidt', " +
                 "or 'unnorm'. Input value is {:s}."
@@ -4185,7 +4274,7 @@ class DHRealGrid(SHGrid):
                                    norm=norm, csphase=csphase,
                                    sampling=self.sampling, **kwargs)
         coeffs = SHCoeffs.from_array(cilm,
-                                     normalization=normalization.lower(),
+                                     normalization=normalization,
                                      csphase=csphase, copy=False)
         return coeffs
 
@@ -4195,7 +4284,8 @@ class DHRealGrid(SHGrid):
               titlesize=None, cmap=None, tick_interval=None, ticks=None,
               minor_tick_interval=None, cb_tick_interval=None, cb_ylabel=None,
               cb_minor_tick_interval=None, cmap_limits=None, cmap_reverse=None,
-              cmap_limits_complex=None, cb_offset=None, cb_width=None):
+              cmap_limits_complex=None, cb_offset=None, cb_width=None,
+              interpolation='nearest'):
         """Plot the data as a matplotlib cylindrical projection,
            or with Cartopy when projection is specified."""
         if ax is None:
@@ -4333,7 +4423,8 @@ class DHRealGrid(SHGrid):
         if projection is not None:
             axes.set_global()
             cim = axes.imshow(
-                self.data, transform=_ccrs.PlateCarree(central_longitude=0.0),
+                _imshow_data(self.data, cmap_limits[0], cmap_limits[1]),
+                transform=_ccrs.PlateCarree(central_longitude=0.0),
                 origin='upper', extent=extent, cmap=cmap_scaled,
                 vmin=cmap_limits[0], vmax=cmap_limits[1])
             if isinstance(projection, _ccrs.PlateCarree):
@@ -4353,9 +4444,16 @@ class DHRealGrid(SHGrid):
                 axes.gridlines(xlocs=xticks-180, ylocs=yticks,
                                crs=_ccrs.PlateCarree(central_longitude=0.0))
         else:
-            cim = axes.imshow(self.data, origin='upper', extent=extent,
+            # Without interpolation, the image is drawn as nearest-neighbour
+            # blocks and resampling in data space only wastes time.
+            resample = False if interpolation == 'nearest' else None
+            cim = axes.imshow(_imshow_data(self.data, cmap_limits[0],
+                                           cmap_limits[1]),
+                              origin='upper', extent=extent,
                               cmap=cmap_scaled, vmin=cmap_limits[0],
-                              vmax=cmap_limits[1])
+                              vmax=cmap_limits[1],
+                              interpolation=interpolation,
+                              resample=resample)
             axes.set(xlim=(0, 360), ylim=(-90, 90))
             axes.set_xlabel(xlabel, fontsize=axes_labelsize)
             axes.set_ylabel(ylabel, fontsize=axes_labelsize)
@@ -4601,6 +4699,9 @@ class DHComplexGrid(SHGrid):
     """
     Class for complex Driscoll and Healy (1994) grids.
     """
+    _xlabel = 'Longitude'
+    _ylabel = 'Latitude'
+
     @staticmethod
     def istype(kind):
         return kind == 'complex'
@@ -4609,7 +4710,7 @@ class DHComplexGrid(SHGrid):
     def isgrid(grid):
         return grid == 'DH'
 
-    def __init__(self, array, copy=True):
+    def __init__(self, array, copy=True, dtype=None):
         self.nlat, self.nlon = array.shape
 
         if self.nlat % 2 != 0:
@@ -4635,43 +4736,30 @@ class DHComplexGrid(SHGrid):
         self.kind = 'complex'
 
         if copy:
-            self.data = _np.copy(array)
+            self.data = _np.array(array, dtype=dtype)
         else:
-            self.data = array
+            self.data = _np.asarray(array, dtype=dtype)
 
     def _lats(self):
         """
         Return a vector containing the latitudes (in degrees) of each row
         of the gridded data.
         """
-        if self.extend:
-            lats = _np.linspace(90.0, -90.0, num=self.nlat)
-        else:
-            lats = _np.linspace(90.0, -90.0 + 180.0 / self.nlat, num=self.nlat)
-        return lats
+        return _dh_lats(self.nlat, self.extend)
 
     def _lons(self):
         """
         Return a vector containing the longitudes (in degrees) of each row
         of the gridded data.
         """
-        if self.extend:
-            lons = _np.linspace(0.0, 360.0, num=self.nlon)
-        else:
-            lons = _np.linspace(0.0, 360.0 - 360.0 / self.nlon, num=self.nlon)
-        return lons
+        return _grid_lons(self.nlon, self.extend)
 
     def _expand(self, normalization, csphase, **kwargs):
         """Expand the grid into real spherical harmonics."""
-        if normalization.lower() == '4pi':
-            norm = 1
-        elif normalization.lower() == 'schmidt':
-            norm = 2
-        elif normalization.lower() == 'schmidt':
-            norm = 3
-        elif normalization.lower() == 'ortho':
-            norm = 4
-        else:
+        normalization = normalization.lower()
+        try:
+            norm = _expand_norms[normalization]
+        except KeyError:
             raise ValueError(
                 "The normalization must be '4pi', 'ortho', 'schmidt', " +
                 "or 'unnorm'. Input value is {:s}."
@@ -4681,7 +4769,7 @@ class DHComplexGrid(SHGrid):
         cilm = _shtools.SHExpandDHC(self.data[:self.nlat-self.extend,
                                               :self.nlon-self.extend],
                                     norm=norm, csphase=csphase, **kwargs)
-        coeffs = SHCoeffs.from_array(cilm, normalization=normalization.lower(),
+        coeffs = SHCoeffs.from_array(cilm, normalization=normalization,
                                      csphase=csphase, copy=False)
         return coeffs
 
@@ -4692,7 +4780,8 @@ class DHComplexGrid(SHGrid):
               tick_interval=None, minor_tick_interval=None, cb_ylabel=None,
               cb_tick_interval=None, cb_minor_tick_interval=None,
               cmap_limits=None, cmap_reverse=None, cmap_limits_complex=None,
-              cb_offset=None, cb_width=None):
+              cb_offset=None, cb_width=None,
+              interpolation='nearest'):
         """Plot the raw data as a matplotlib simple cylindrical projection,
            or with Cartopy when projection is specified."""
         if ax is None:
@@ -4724,7 +4813,7 @@ class DHComplexGrid(SHGrid):
                             xlabel=xlabel, ylabel=ylabel, cb_ylabel=cb_ylabel,
                             cb_width=cb_width, cmap=cmap,
                             cmap_limits=cmap_limits, cmap_reverse=cmap_reverse,
-                            ax=axreal)
+                            ax=axreal, interpolation=interpolation)
 
         self.to_imag().plot(projection=projection, tick_interval=tick_interval,
                             minor_tick_interval=minor_tick_interval,
@@ -4738,7 +4827,7 @@ class DHComplexGrid(SHGrid):
                             cmap=cmap, cmap_limits=cmap_limits_complex,
                             cmap_reverse=cmap_reverse, cb_offset=cb_offset,
                             cb_width=cb_width, xlabel=xlabel, ylabel=ylabel,
-                            ax=axcomplex)
+                            ax=axcomplex, interpolation=interpolation)
 
         if ax is None:
             return fig, axes
@@ -4807,6 +4896,9 @@ class GLQRealGrid(SHGrid):
     """
     Class for real Gauss-Legendre Quadrature grids.
     """
+    _xlabel = 'GLQ longitude index'
+    _ylabel = 'GLQ latitude index'
+
     @staticmethod
     def istype(kind):
         return kind == 'real'
@@ -4815,7 +4907,8 @@ class GLQRealGrid(SHGrid):
     def isgrid(grid):
         return grid == 'GLQ'
 
-    def __init__(self, array, zeros=None, weights=None, copy=True):
+    def __init__(self, array, zeros=None, weights=None, copy=True,
+                 dtype=None):
         self.nlat, self.nlon = array.shape
         self.lmax = self.nlat - 1
 
@@ -4831,25 +4924,31 @@ class GLQRealGrid(SHGrid):
                                      2*self.lmax+2)
                              )
 
-        if zeros is None or weights is None:
-            self.zeros, self.weights = _shtools.SHGLQ(self.lmax)
+        # Record whether the cached nodes are used, so that _lats() can
+        # return the cached latitudes without recomputing the nodes.
+        self._shared_nodes = zeros is None or weights is None
+        if self._shared_nodes:
+            self.zeros, self.weights = _glq_nodes_weights(self.lmax)
         else:
-            self.zeros = zeros
-            self.weights = weights
+            self.zeros = _read_only(zeros)
+            self.weights = _read_only(weights)
 
         self.grid = 'GLQ'
         self.kind = 'real'
         if copy:
-            self.data = _np.copy(array)
+            self.data = _np.array(array, dtype=dtype)
         else:
-            self.data = array
+            self.data = _np.asarray(array, dtype=dtype)
 
     def _lats(self):
         """
         Return a vector containing the latitudes (in degrees) of each row
         of the gridded data.
         """
-        lats = 90. - _np.arccos(self.zeros) * 180. / _np.pi
+        if self._shared_nodes:
+            return _glq_lats(self.lmax)
+        lats = _np.arcsin(self.zeros)
+        _np.rad2deg(lats, out=lats)
         return lats
 
     def _lons(self):
@@ -4857,25 +4956,16 @@ class GLQRealGrid(SHGrid):
         Return a vector containing the longitudes (in degrees) of each column
         of the gridded data.
         """
-        if self.extend:
-            lons = _np.linspace(0.0, 360.0, num=self.nlon)
-        else:
-            lons = _np.linspace(0.0, 360.0 - 360.0 / self.nlon, num=self.nlon)
-        return lons
+        return _grid_lons(self.nlon, self.extend)
 
     def _expand(self, normalization, csphase, **kwargs):
         """Expand the grid into real spherical harmonics."""
-        if normalization.lower() == '4pi':
-            norm = 1
-        elif normalization.lower() == 'schmidt':
-            norm = 2
-        elif normalization.lower() == 'unnorm':
-            norm = 3
-        elif normalization.lower() == 'ortho':
-            norm = 4
-        else:
+        normalization = normalization.lower()
+        try:
+            norm = _expand_norms[normalization]
+        except KeyError:
             raise ValueError(
-                "The normalization must be '4pi', 'ortho', 'schmidt' " +
+                "The normalization must be '4pi', 'ortho', 'schmidt', " +
                 "or 'unnorm'. Input value is {:s}."
                 .format(repr(normalization))
                 )
@@ -4883,7 +4973,7 @@ class GLQRealGrid(SHGrid):
         cilm = _shtools.SHExpandGLQ(self.data[:, :self.nlon-self.extend],
                                     self.weights, self.zeros, norm=norm,
                                     csphase=csphase, **kwargs)
-        coeffs = SHCoeffs.from_array(cilm, normalization=normalization.lower(),
+        coeffs = SHCoeffs.from_array(cilm, normalization=normalization,
                                      csphase=csphase, copy=False)
         return coeffs
 
@@ -4894,7 +4984,8 @@ class GLQRealGrid(SHGrid):
               minor_tick_interval=None, cb_tick_interval=None, ticks=None,
               cb_minor_tick_interval=None, cmap_limits=None, cmap_reverse=None,
               cmap_limits_complex=None, cb_ylabel=None, cb_offset=None,
-              cb_width=None):
+              cb_width=None,
+              interpolation='nearest'):
         """Plot the data using a matplotlib cylindrical projection."""
         if ax is None:
             if colorbar is not None:
@@ -5006,9 +5097,13 @@ class GLQRealGrid(SHGrid):
 
         # plot image, ticks, and annotations
         extent = (-0.5, self.nlon-0.5, -0.5, self.nlat-0.5)
-        cim = axes.imshow(self.data, extent=extent, origin='upper',
+        resample = False if interpolation == 'nearest' else None
+        cim = axes.imshow(_imshow_data(self.data, cmap_limits[0],
+                                       cmap_limits[1]),
+                          extent=extent, origin='upper',
                           cmap=cmap_scaled, vmin=cmap_limits[0],
-                          vmax=cmap_limits[1])
+                          vmax=cmap_limits[1],
+                          interpolation=interpolation, resample=resample)
         axes.set(xticks=xticks, yticks=yticks)
         axes.set_xlabel(xlabel, fontsize=axes_labelsize)
         axes.set_ylabel(ylabel, fontsize=axes_labelsize)
@@ -5116,6 +5211,9 @@ class GLQComplexGrid(SHGrid):
     """
     Class for complex Gauss-Legendre Quadrature grids.
     """
+    _xlabel = 'GLQ longitude index'
+    _ylabel = 'GLQ latitude index'
+
     @staticmethod
     def istype(kind):
         return kind == 'complex'
@@ -5124,7 +5222,8 @@ class GLQComplexGrid(SHGrid):
     def isgrid(grid):
         return grid == 'GLQ'
 
-    def __init__(self, array, zeros=None, weights=None, copy=True):
+    def __init__(self, array, zeros=None, weights=None, copy=True,
+                 dtype=None):
         self.nlat, self.nlon = array.shape
         self.lmax = self.nlat - 1
 
@@ -5140,46 +5239,43 @@ class GLQComplexGrid(SHGrid):
                                      2*self.lmax+2)
                              )
 
-        if zeros is None or weights is None:
-            self.zeros, self.weights = _shtools.SHGLQ(self.lmax)
+        # Record whether the cached nodes are used, so that _lats() can
+        # return the cached latitudes without recomputing the nodes.
+        self._shared_nodes = zeros is None or weights is None
+        if self._shared_nodes:
+            self.zeros, self.weights = _glq_nodes_weights(self.lmax)
         else:
-            self.zeros = zeros
-            self.weights = weights
+            self.zeros = _read_only(zeros)
+            self.weights = _read_only(weights)
 
         self.grid = 'GLQ'
         self.kind = 'complex'
 
         if copy:
-            self.data = _np.copy(array)
+            self.data = _np.array(array, dtype=dtype)
         else:
-            self.data = array
+            self.data = _np.asarray(array, dtype=dtype)
 
     def _lats(self):
         """Return the latitudes (in degrees) of the gridded data rows."""
-        lats = 90. - _np.arccos(self.zeros) * 180. / _np.pi
+        if self._shared_nodes:
+            return _glq_lats(self.lmax)
+        lats = _np.arcsin(self.zeros)
+        _np.rad2deg(lats, out=lats)
         return lats
 
     def _lons(self):
         """Return the longitudes (in degrees) of the gridded data columns."""
-        if self.extend:
-            lons = _np.linspace(0.0, 360.0, num=self.nlon)
-        else:
-            lons = _np.linspace(0.0, 360.0 - 360.0 / self.nlon, num=self.nlon)
-        return lons
+        return _grid_lons(self.nlon, self.extend)
 
     def _expand(self, normalization, csphase, **kwargs):
         """Expand the grid into real spherical harmonics."""
-        if normalization.lower() == '4pi':
-            norm = 1
-        elif normalization.lower() == 'schmidt':
-            norm = 2
-        elif normalization.lower() == 'unnorm':
-            norm = 3
-        elif normalization.lower() == 'ortho':
-            norm = 4
-        else:
+        normalization = normalization.lower()
+        try:
+            norm = _expand_norms[normalization]
+        except KeyError:
             raise ValueError(
-                "The normalization must be '4pi', 'ortho', 'schmidt' " +
+                "The normalization must be '4pi', 'ortho', 'schmidt', " +
                 "or 'unnorm'. Input value is {:s}."
                 .format(repr(normalization))
                 )
@@ -5187,7 +5283,7 @@ class GLQComplexGrid(SHGrid):
         cilm = _shtools.SHExpandGLQC(self.data[:, :self.nlon-self.extend],
                                      self.weights, self.zeros, norm=norm,
                                      csphase=csphase, **kwargs)
-        coeffs = SHCoeffs.from_array(cilm, normalization=normalization.lower(),
+        coeffs = SHCoeffs.from_array(cilm, normalization=normalization,
                                      csphase=csphase, copy=False)
         return coeffs
 
@@ -5198,7 +5294,8 @@ class GLQComplexGrid(SHGrid):
               titlesize=None, cmap=None, tick_interval=None, cb_ylabel=None,
               minor_tick_interval=None, cb_tick_interval=None,
               cb_minor_tick_interval=None, cmap_limits=None, cmap_reverse=None,
-              cmap_limits_complex=None, cb_offset=None, cb_width=None):
+              cmap_limits_complex=None, cb_offset=None, cb_width=None,
+              interpolation='nearest'):
         """Plot the raw data using a simply cylindrical projection."""
         if ax is None:
             if colorbar is not None:
@@ -5229,7 +5326,7 @@ class GLQComplexGrid(SHGrid):
                             xlabel=xlabel, ylabel=ylabel, cb_ylabel=cb_ylabel,
                             cb_width=cb_width, cmap=cmap,
                             cmap_limits=cmap_limits, cmap_reverse=cmap_reverse,
-                            ax=axreal)
+                            ax=axreal, interpolation=interpolation)
 
         self.to_imag().plot(projection=projection, tick_interval=tick_interval,
                             minor_tick_interval=minor_tick_interval,
@@ -5243,7 +5340,7 @@ class GLQComplexGrid(SHGrid):
                             cmap=cmap, cmap_limits=cmap_limits_complex,
                             cmap_reverse=cmap_reverse, cb_ylabel=cb_ylabel,
                             cb_width=cb_width, xlabel=xlabel, ylabel=ylabel,
-                            ax=axcomplex)
+                            ax=axcomplex, interpolation=interpolation)
 
         if ax is None:
             return fig, axes
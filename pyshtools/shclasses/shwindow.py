@@ -8,16 +8,152 @@ import matplotlib as _mpl
 import matplotlib.pyplot as _plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable as _make_axes_locatable
 import copy as _copy
+import functools as _functools
 
 from .. import shtools as _shtools
-from ..spectralanalysis import spectrum as _spectrum
 
 from .shcoeffsgrid import SHCoeffs
 from .shcoeffsgrid import SHGrid
+from .shcoeffsgrid import _glq_nodes_weights
 
 
 __all__ = ['SHWindow', 'SHWindowCap', 'SHWindowMask']
 
+# Normalizations and grids accepted for the output of the windows
+_valid_norms = frozenset(('4pi', 'ortho', 'schmidt'))
+_valid_grids = frozenset(('DH', 'DH1', 'DH2', 'GLQ'))
+
+
+def _check_norm(normalization):
+    """Return the validated, lowercase normalization."""
+    if not isinstance(normalization, str):
+        raise ValueError('normalization must be a string. ' +
+                         'Input type is {:s}.'
+                         .format(str(type(normalization))))
+
+    norm = normalization.lower()
+    if norm not in _valid_norms:
+        raise ValueError(
+            "normalization must be '4pi', 'ortho' " +
+            "or 'schmidt'. Provided value is {:s}."
+            .format(repr(normalization))
+            )
+    return norm
+
+
+def _check_grid(grid):
+    """Return the validated, uppercase grid type."""
+    if not isinstance(grid, str):
+        raise ValueError('grid must be a string. Input type is {:s}.'
+                         .format(str(type(grid))))
+
+    grid_upper = grid.upper()
+    if grid_upper not in _valid_grids:
+        raise ValueError(
+            "grid must be 'DH', 'DH1', 'DH2', or 'GLQ'. " +
+            "Input value is {:s}.".format(repr(grid)))
+    return grid_upper
+
+
+@_functools.lru_cache(maxsize=4)
+def _djpi2(lmax):
+    """
+    Return the read-only djpi2 rotation matrix for degree lmax, shared by all
+    SHWindowCap instances with the same bandwidth.
+    """
+    dj_matrix = _shtools.djpi2(lmax)
+    dj_matrix.flags.writeable = False
+    return dj_matrix
+
+
+@_functools.lru_cache(maxsize=16)
+def _to_array_factor(lwin, normalization, csphase):
+    """
+    Return the read-only array that converts 4pi-normalized coefficients
+    without the Condon-Shortley phase to the given normalization and phase
+    convention, or None if no conversion is required.
+    """
+    if normalization == '4pi' and csphase == 1:
+        return None
+
+    factor = _np.ones((1, lwin + 1, lwin + 1))
+    if normalization == 'schmidt':
+        factor *= _np.sqrt(2.0 * _np.arange(lwin + 1) + 1.0)[:, None]
+    elif normalization == 'ortho':
+        factor *= _np.sqrt(4.0 * _np.pi)
+
+    if csphase == -1:
+        factor[:, :, 1::2] *= -1.
+
+    factor.flags.writeable = False
+    return factor
+
+
+@_functools.lru_cache(maxsize=16)
+def _cilm_vector_indices(lmax):
+    """
+    Return the (i, l, m) index arrays that map the elements of a spherical
+    harmonic coefficient vector, ordered as in SHCilmToVector, to their
+    positions in an array of dimension (2, lmax+1, lmax+1).
+    """
+    index = _np.arange((lmax + 1)**2)
+    degree = _np.sqrt(index).astype(int)
+    order = index - degree**2
+    i = (order > degree).astype(int)
+    order -= i * degree
+    for array in (i, degree, order):
+        array.flags.writeable = False
+    return i, degree, order
+
+
+def _vector_to_cilm(vector, lmax):
+    """
+    Unpack a spherical harmonic coefficient vector, ordered as in
+    SHCilmToVector, into an array of dimension (2, lmax+1, lmax+1).
+    """
+    cilm = _np.zeros((2, lmax + 1, lmax + 1))
+    cilm[_cilm_vector_indices(lmax)] = vector
+    return cilm
+
+
+def _multitaper_scale(n, convention='power', unit='per_l'):
+    """
+    Return the vector of length n that converts a 'power', 'per_l' multitaper
+    spectrum to the requested convention and unit.
+    """
+    if (unit == 'per_l'):
+        scale = _np.ones(n)
+    elif (unit == 'per_lm'):
+        scale = 1.0 / (2.0 * _np.arange(n) + 1.0)
+    else:
+        raise ValueError(
+            "unit must be 'per_l' or 'per_lm'." +
+            "Input value is {:s}.".format(repr(unit)))
+
+    if (convention == 'power'):
+        pass
+    elif (convention == 'energy'):
+        scale *= 4.0 * _np.pi
+    else:
+        raise ValueError(
+            "convention must be 'power' or 'energy'." +
+            "Input value is {:s}.".format(repr(convention)))
+
+    return scale
+
+
+def _vector_power(vectors, lmax):
+    """
+    Return the sum of the squares of the coefficients at each degree for the
+    columns of an array of spherical harmonic coefficient vectors, ordered as
+    in SHCilmToVector, where degree l occupies rows l**2 to (l+1)**2-1.
+
+    The reduction is performed on the transpose, so that the output is in
+    Fortran order and can be passed to the Fortran routines without a copy.
+    """
+    return _np.add.reduceat(vectors.T**2, _np.arange(lmax + 1)**2,
+                            axis=1).T
+
 
 class SHWindow(object):
     """
@@ -99,6 +235,8 @@ class SHWindow(object):
     variance()             : Compute the theoretical variance of a windowed
                              function for a given input power spectrum.
     copy()                 : Return a copy of the class instance.
+    clear_djpi2_cache()    : Clear the cache of djpi2 rotation matrices shared
+                             by the spherical cap windows.
     plot_windows()         : Plot the best concentrated localization windows
                              using a simple cylindrical projection.
     plot_spectra()         : Plot the spectra of the best-concentrated
@@ -114,6 +252,18 @@ class SHWindow(object):
               '>>> pyshtools.SHWindow.from_cap\n'
               '>>> pyshtools.SHWindow.from_mask')
 
+    @classmethod
+    def clear_djpi2_cache(cls):
+        """
+        Clear the cache of djpi2 rotation matrices that are shared by all
+        spherical cap windows with the same bandwidth.
+
+        Usage
+        -----
+        SHWindow.clear_djpi2_cache()
+        """
+        _djpi2.cache_clear()
+
     # ---- factory methods:
     @classmethod
     def from_cap(cls, theta, lwin, clat=None, clon=None, nwin=None,
@@ -159,7 +309,7 @@ class SHWindow(object):
         """
         if theta_degrees:
             tapers, eigenvalues, taper_order = _shtools.SHReturnTapers(
-                _np.radians(theta), lwin, degrees=taper_degrees)
+                theta * _np.pi / 180., lwin, degrees=taper_degrees)
         else:
             tapers, eigenvalues, taper_order = _shtools.SHReturnTapers(
                 theta, lwin, degrees=taper_degrees)
@@ -240,6 +390,22 @@ class SHWindow(object):
         """Return a deep copy of the class instance."""
         return _copy.deepcopy(self)
 
+    def __deepcopy__(self, memo):
+        """
+        Copy the array attributes directly, sharing the read-only arrays,
+        such as the cached djpi2 matrix, with the original instance.
+        """
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        for key, value in self.__dict__.items():
+            if isinstance(value, _np.ndarray):
+                if value.flags.writeable:
+                    value = value.copy()
+            else:
+                value = _copy.deepcopy(value, memo)
+            new.__dict__[key] = value
+        return new
+
     def degrees(self):
         """
         Return a numpy array listing the spherical harmonic degrees of the
@@ -277,7 +443,10 @@ class SHWindow(object):
             The concentration factor, which is the power of the window within
             the concentration region divided by the total power.
         """
-        return len(self.eigenvalues[self.eigenvalues >= concentration])
+        # The eigenvalues are ordered from largest to smallest, so the count
+        # can be found by a binary search of the reversed (ascending) view.
+        return len(self.eigenvalues) - int(_np.searchsorted(
+            self.eigenvalues[::-1], concentration, side='left'))
 
     def to_array(self, itaper, normalization='4pi', csphase=1):
         """
@@ -306,25 +475,14 @@ class SHWindow(object):
             Condon-Shortley phase convention: 1 to exclude the phase factor,
             or -1 to include it.
         """
-        if type(normalization) != str:
-            raise ValueError('normalization must be a string. ' +
-                             'Input type is {:s}.'
-                             .format(str(type(normalization))))
-
-        if normalization.lower() not in ('4pi', 'ortho', 'schmidt'):
-            raise ValueError(
-                "normalization must be '4pi', 'ortho' " +
-                "or 'schmidt'. Provided value is {:s}."
-                .format(repr(normalization))
-                )
+        norm = _check_norm(normalization)
         if csphase != 1 and csphase != -1:
             raise ValueError(
                 "csphase must be 1 or -1. Input value is {:s}."
                 .format(repr(csphase))
                 )
 
-        return self._to_array(
-            itaper, normalization=normalization.lower(), csphase=csphase)
+        return self._to_array(itaper, normalization=norm, csphase=csphase)
 
     def to_shcoeffs(self, itaper, normalization='4pi', csphase=1):
         """
@@ -351,26 +509,15 @@ class SHWindow(object):
             Condon-Shortley phase convention: 1 to exclude the phase factor,
             or -1 to include it.
         """
-        if type(normalization) != str:
-            raise ValueError('normalization must be a string. ' +
-                             'Input type is {:s}.'
-                             .format(str(type(normalization))))
-
-        if normalization.lower() not in set(['4pi', 'ortho', 'schmidt']):
-            raise ValueError(
-                "normalization must be '4pi', 'ortho' " +
-                "or 'schmidt'. Provided value is {:s}."
-                .format(repr(normalization))
-                )
+        norm = _check_norm(normalization)
         if csphase != 1 and csphase != -1:
             raise ValueError(
                 "csphase must be 1 or -1. Input value is {:s}."
                 .format(repr(csphase))
                 )
 
-        coeffs = self.to_array(itaper, normalization=normalization.lower(),
-                               csphase=csphase)
-        return SHCoeffs.from_array(coeffs, normalization=normalization.lower(),
+        coeffs = self._to_array(itaper, normalization=norm, csphase=csphase)
+        return SHCoeffs.from_array(coeffs, normalization=norm,
                                    csphase=csphase, copy=False)
 
     def to_shgrid(self, itaper, grid='DH2', zeros=None, extend=True):
@@ -407,23 +554,21 @@ class SHWindow(object):
         the properties of the output grids, see the documentation for
         SHExpandDH and SHExpandGLQ.
         """
-        if type(grid) != str:
-            raise ValueError('grid must be a string. Input type is {:s}.'
-                             .format(str(type(grid))))
-
-        if grid.upper() in ('DH', 'DH1'):
-            gridout = _shtools.MakeGridDH(self.to_array(itaper), sampling=1,
-                                          norm=1, csphase=1, extend=extend)
+        grid = _check_grid(grid)
+        coeffs = self._to_array(itaper)
+        if grid in ('DH', 'DH1'):
+            gridout = _shtools.MakeGridDH(coeffs, sampling=1, norm=1,
+                                          csphase=1, extend=extend)
             return SHGrid.from_array(gridout, grid='DH', copy=False)
-        elif grid.upper() == 'DH2':
-            gridout = _shtools.MakeGridDH(self.to_array(itaper), sampling=2,
-                                          norm=1, csphase=1, extend=extend)
+        elif grid == 'DH2':
+            gridout = _shtools.MakeGridDH(coeffs, sampling=2, norm=1,
+                                          csphase=1, extend=extend)
             return SHGrid.from_array(gridout, grid='DH', copy=False)
-        elif grid.upper() == 'GLQ':
+        elif grid == 'GLQ':
             if zeros is None:
-                zeros, weights = _shtools.SHGLQ(self.lwin)
-            gridout = _shtools.MakeGridGLQ(self.to_array(itaper), zeros,
-                                           norm=1, csphase=1, extend=extend)
+                zeros, weights = _glq_nodes_weights(self.lwin)
+            gridout = _shtools.MakeGridGLQ(coeffs, zeros, norm=1, csphase=1,
+                                           extend=extend)
             return SHGrid.from_array(gridout, grid='GLQ', copy=False)
         else:
             raise ValueError(
@@ -602,9 +747,17 @@ class SHWindow(object):
         save_cg : int, optional, default = 0
             If 1, the Clebsch-Gordon coefficients will be precomputed and saved
             for future use. If 0, the Clebsch-Gordon coefficients will be
-            recomputed for each call.
+            recomputed for each call. If -1, the memory used by the saved
+            coefficients will be deallocated.
         ldata : int, optional, default = len(power)-1
             The maximum degree of the global unwindowed spectrum.
+
+        Notes
+        -----
+        The Clebsch-Gordon coefficients saved with save_cg=1 depend only on
+        lwin and ldata. They are reused by all subsequent calls with save_cg=1,
+        including calls from other windows of the same kind, and are
+        recomputed automatically when either lwin or ldata changes.
         """
         if weights is not None:
             if len(weights) != k:
@@ -680,20 +833,46 @@ class SHWindow(object):
         spectrum(l, 'per_l')*l*log(a).
 
          """
+        convention = convention.lower()
+        unit = unit.lower()
+        if convention not in ('power', 'energy', 'l2norm'):
+            raise ValueError("convention must be 'power', 'energy', or " +
+                             "'l2norm'. Input value was {:s}"
+                             .format(repr(convention)))
+        if unit not in ('per_l', 'per_lm', 'per_dlogl'):
+            raise ValueError("unit must be 'per_l', 'per_lm', or " +
+                             "'per_dlogl'. Input value was {:s}"
+                             .format(repr(unit)))
+
+        # The l2norm spectrum of the 4pi-normalized coefficients is not
+        # rescaled by either the convention or the unit.
+        if convention == 'l2norm':
+            scale = None
+        else:
+            degrees = self.degrees()
+            scale = _np.full(self.lwin + 1,
+                             4. * _np.pi if convention == 'energy' else 1.)
+            if unit == 'per_lm':
+                scale /= (2. * degrees + 1.)
+            elif unit == 'per_dlogl':
+                scale *= degrees * _np.log(base)
+
         if itaper is None:
             if nwin is None:
                 nwin = self.nwin
-            spectra = _np.zeros((self.lwin+1, nwin))
-
-            for iwin in range(nwin):
-                coeffs = self.to_array(iwin)
-                spectra[:, iwin] = _spectrum(coeffs, normalization='4pi',
-                                             convention=convention, unit=unit,
-                                             base=base)
+            elif nwin > self.nwin:
+                raise ValueError('nwin must be less than or equal to ' +
+                                 'nwin of the class instance. ' +
+                                 'nwin = {:d}, self.nwin = {:d}.'
+                                 .format(nwin, self.nwin))
+            spectra = self._power_stack(nwin)
+            if scale is not None:
+                spectra *= scale[:, None]
         else:
-            coeffs = self.to_array(itaper)
-            spectra = _spectrum(coeffs, normalization='4pi',
-                                convention=convention, unit=unit, base=base)
+            coeffs = self._to_array(itaper)
+            spectra = _np.einsum('ijk,ijk->j', coeffs, coeffs)
+            if scale is not None:
+                spectra *= scale
 
         return spectra
 
@@ -746,17 +925,19 @@ class SHWindow(object):
         else:
             weights = self.weights
 
+        if mode not in ('full', 'same', 'valid'):
+            raise ValueError("mode has to be 'full', 'same' or 'valid', not "
+                             "{}.".format(mode))
+
+        # SHMTCouplingMatrix always returns all lmax+lwin+1 rows, so the
+        # 'same' and 'valid' modes are returned as views of the full matrix.
+        cmatrix = self._coupling_matrix(lmax, k=k, weights=weights)
         if mode == 'full':
-            return self._coupling_matrix(lmax, k=k, weights=weights)
+            return cmatrix
         elif mode == 'same':
-            cmatrix = self._coupling_matrix(lmax, k=k, weights=weights)
             return cmatrix[:lmax+1, :]
-        elif mode == 'valid':
-            cmatrix = self._coupling_matrix(lmax, k=k, weights=weights)
-            return cmatrix[:lmax - self.lwin+1, :]
         else:
-            raise ValueError("mode has to be 'full', 'same' or 'valid', not "
-                             "{}.".format(mode))
+            return cmatrix[:lmax - self.lwin+1, :]
 
     def variance(self, power, k, lmax=None, weights=None):
         """
@@ -932,10 +1113,17 @@ class SHWindow(object):
                 axtemp = axes.flatten()[itaper]
             else:
                 axtemp = axes[itaper]
-            coeffs = self.to_shcoeffs(itaper)
-            if lmax is not None:
-                coeffs = coeffs.pad(lmax=lmax, copy=False)
-            grid_temp = coeffs.expand()
+            # The grids depend only on the taper and lmax, and are reused by
+            # later calls until the windows are rotated. They are only used
+            # for display, so they are stored in single precision.
+            if (itaper, lmax) not in self._grid_cache:
+                coeffs = self.to_shcoeffs(itaper)
+                if lmax is not None:
+                    coeffs = coeffs.pad(lmax=lmax, copy=False)
+                grid_temp = coeffs.expand()
+                self._grid_cache[itaper, lmax] = SHGrid.from_array(
+                    grid_temp.data, grid=grid_temp.grid, dtype=_np.float32)
+            grid_temp = self._grid_cache[itaper, lmax]
 
             if title:
                 if loss:
@@ -962,20 +1150,8 @@ class SHWindow(object):
                            titlesize=titlesize, ax=axtemp)
 
         if ax is None and projection is None:
-            if nrows > 1:
-                for axtemp in axes[:-1, :].flatten():
-                    for xlabel_i in axtemp.get_xticklabels():
-                        xlabel_i.set_visible(False)
-                    axtemp.set_xlabel('', visible=False)
-                for axtemp in axes[:, 1:].flatten():
-                    for ylabel_i in axtemp.get_yticklabels():
-                        ylabel_i.set_visible(False)
-                    axtemp.set_ylabel('', visible=False)
-            elif nwin > 1:
-                for axtemp in axes[1:].flatten():
-                    for ylabel_i in axtemp.get_yticklabels():
-                        ylabel_i.set_visible(False)
-                    axtemp.set_ylabel('', visible=False)
+            for axtemp in _np.atleast_1d(axes).flat:
+                axtemp.label_outer()
 
         if ax is None:
             fig.tight_layout(pad=0.5)
@@ -1074,22 +1250,6 @@ class SHWindow(object):
                                  ' and ax.size = {:s}.'.format(repr(ax.size)))
             axes = ax
 
-        if ax is None:
-            if nrows > 1:
-                for axtemp in axes[:-1, :].flatten():
-                    for xlabel_i in axtemp.get_xticklabels():
-                        xlabel_i.set_visible(False)
-                    axtemp.set_xlabel('', visible=False)
-                for axtemp in axes[:, 1:].flatten():
-                    for ylabel_i in axtemp.get_yticklabels():
-                        ylabel_i.set_visible(False)
-                    axtemp.set_ylabel('', visible=False)
-            elif nwin > 1:
-                for axtemp in axes[1:].flatten():
-                    for ylabel_i in axtemp.get_yticklabels():
-                        ylabel_i.set_visible(False)
-                    axtemp.set_ylabel('', visible=False)
-
         if ylim == (None, None):
             upper = spectrum[:, :min(self.nwin, nwin)].max()
             lower = upper * 1.e-6
@@ -1139,6 +1299,8 @@ class SHWindow(object):
                 axtemp.set_title(title_str, fontsize=titlesize)
 
         if ax is None:
+            for axtemp in _np.atleast_1d(axes).flat:
+                axtemp.label_outer()
             fig.tight_layout(pad=0.5)
             if show:
                 fig.show()
@@ -1240,11 +1402,14 @@ class SHWindow(object):
         if title_labelsize is None:
             tick_labelsize = _mpl.rcParams['axes.titlesize']
 
+        if colorbar is not None:
+            cb_orientation = colorbar.lower()[0]
+
         if ax is None:
             if colorbar is not None:
-                if colorbar.lower()[0] == 'h':
+                if cb_orientation == 'h':
                     scale = 1.1
-                elif colorbar.lower()[0] == 'v':
+                elif cb_orientation == 'v':
                     scale = 0.85
                 else:
                     raise ValueError("colorbar must be either 'horizontal' or "
@@ -1274,11 +1439,11 @@ class SHWindow(object):
         axes.minorticks_on()
 
         if colorbar is not None:
-            if colorbar.lower()[0] == 'v':
+            if cb_orientation == 'v':
                 divider = _make_axes_locatable(axes)
                 cax = divider.append_axes("right", size="2.5%", pad=0.15)
                 cbar = _plt.colorbar(cim, cax=cax, orientation='vertical')
-            elif colorbar.lower()[0] == 'h':
+            elif cb_orientation == 'h':
                 divider = _make_axes_locatable(axes)
                 cax = divider.append_axes("bottom", size="2.5%", pad=0.5)
                 cbar = _plt.colorbar(cim, cax=cax, orientation='horizontal')
@@ -1330,9 +1495,10 @@ class SHWindowCap(SHWindow):
         self.weights = weights
         self.nwinrot = None
         self.taper_degrees = taper_degrees
+        self._grid_cache = {}
 
         if (self.theta_degrees):
-            self.area = 2 * _np.pi * (1 - _np.cos(_np.radians(self.theta)))
+            self.area = 2 * _np.pi * (1 - _np.cos(self.theta * _np.pi / 180.))
         else:
             self.area = 2 * _np.pi * (1 - _np.cos(self.theta))
 
@@ -1355,6 +1521,9 @@ class SHWindowCap(SHWindow):
             self.eigenvalues = eigenvalues[:self.nwin]
             self.orders = taper_order[:self.nwin]
 
+        # The squared tapers are computed on first use by _coupling_matrix.
+        self._tapers_power = None
+
         # If the windows aren't rotated, don't store them.
         if self.clat is None and self.clon is None:
             self.coeffs = None
@@ -1388,27 +1557,35 @@ class SHWindowCap(SHWindow):
         array, where i = 0 is the best concentrated.
         """
         if self.coeffs is None:
-            coeffs = _np.copy(self._taper2coeffs(itaper))
+            coeffs = self._taper2coeffs(itaper)
         else:
             if itaper > self.nwinrot - 1:
                 raise ValueError('itaper must be less than or equal to ' +
                                  'nwinrot - 1. itaper = {:d}, nwinrot = {:d}.'
                                  .format(itaper, self.nwinrot))
-            coeffs = _shtools.SHVectorToCilm(self.coeffs[:, itaper])
-
-        if normalization == 'schmidt':
-            for l in range(self.lwin + 1):
-                coeffs[:, l, :l+1] *= _np.sqrt(2.0 * l + 1.0)
-        elif normalization == 'ortho':
-            coeffs *= _np.sqrt(4.0 * _np.pi)
+            coeffs = _vector_to_cilm(self.coeffs[:, itaper], self.lwin)
 
-        if csphase == -1:
-            for m in range(self.lwin + 1):
-                if m % 2 == 1:
-                    coeffs[:, :, m] = - coeffs[:, :, m]
+        factor = _to_array_factor(self.lwin, normalization, csphase)
+        if factor is not None:
+            coeffs *= factor
 
         return coeffs
 
+    def _power_stack(self, nwin):
+        """
+        Return the sum of the squares of the 4pi-normalized coefficients at
+        each degree for the first nwin tapers, with dimension (lwin+1, nwin).
+        """
+        if self.coeffs is None:
+            # Each unrotated taper has a single nonzero order.
+            return self.tapers[:, :nwin]**2
+        else:
+            if nwin > self.nwinrot:
+                raise ValueError('nwin must be less than or equal to ' +
+                                 'nwinrot. nwin = {:d}, nwinrot = {:d}.'
+                                 .format(nwin, self.nwinrot))
+            return _vector_power(self.coeffs[:, :nwin], self.lwin)
+
     def rotate(self, clat, clon, coord_degrees=True, dj_matrix=None,
                nwinrot=None):
         """"
@@ -1443,6 +1620,7 @@ class SHWindowCap(SHWindow):
         ordered according to the convention in SHCilmToVector.
         """
         self.coeffs = _np.zeros(((self.lwin + 1)**2, self.nwin))
+        self._grid_cache = {}
         self.clat = clat
         self.clon = clon
         self.coord_degrees = coord_degrees
@@ -1459,16 +1637,23 @@ class SHWindowCap(SHWindow):
 
         if dj_matrix is None:
             if self.dj_matrix is None:
-                self.dj_matrix = _shtools.djpi2(self.lwin + 1)
+                self.dj_matrix = _djpi2(self.lwin + 1)
                 dj_matrix = self.dj_matrix
             else:
                 dj_matrix = self.dj_matrix
 
         if ((coord_degrees is True and clat == 90. and clon == 0.) or
                 (coord_degrees is False and clat == _np.pi/2. and clon == 0.)):
-            for i in range(self.nwinrot):
-                coeffs = self._taper2coeffs(i)
-                self.coeffs[:, i] = _shtools.SHCilmToVector(coeffs)
+            # Scatter each unrotated taper, which has a single order m, into
+            # the rows l**2 + i*l + |m| of the vector ordering of
+            # SHCilmToVector, where i is 1 for negative orders.
+            degrees = _np.arange(self.lwin + 1)[:, None]
+            orders = self.orders[:self.nwinrot][None, :]
+            rows = degrees**2 + (orders < 0) * degrees + _np.abs(orders)
+            cols = _np.broadcast_to(_np.arange(self.nwinrot), rows.shape)
+            valid = degrees >= _np.abs(orders)
+            self.coeffs[rows[valid], cols[valid]] = \
+                self.tapers[:, :self.nwinrot][valid]
 
         else:
             coeffs = _shtools.SHRotateTapers(self.tapers, self.orders,
@@ -1483,7 +1668,10 @@ class SHWindowCap(SHWindow):
         if weights is None:
             weights = self.weights
 
-        return _shtools.SHMTCouplingMatrix(lmax, self.tapers**2, k=k,
+        if self._tapers_power is None:
+            self._tapers_power = self.tapers**2
+
+        return _shtools.SHMTCouplingMatrix(lmax, self._tapers_power, k=k,
                                            taper_wt=weights)
 
     def _multitaper_spectrum(self, clm, k, convention='power', unit='per_l',
@@ -1530,25 +1718,10 @@ class SHWindowCap(SHWindow):
         mtse, sd = _shtools.SHMultiTaperMaskSE(sh, self.coeffs, lmax=lmax,
                                                k=k, taper_wt=weights)
 
-        if (unit == 'per_l'):
-            pass
-        elif (unit == 'per_lm'):
-            degree_l = _np.arange(len(mtse))
-            mtse /= (2.0 * degree_l + 1.0)
-            sd /= (2.0 * degree_l + 1.0)
-        else:
-            raise ValueError(
-                "unit must be 'per_l' or 'per_lm'." +
-                "Input value is {:s}.".format(repr(unit)))
-
-        if (convention == 'power'):
-            return mtse, sd
-        elif (convention == 'energy'):
-            return mtse * 4.0 * _np.pi, sd * 4.0 * _np.pi
-        else:
-            raise ValueError(
-                "convention must be 'power' or 'energy'." +
-                "Input value is {:s}.".format(repr(convention)))
+        scale = _multitaper_scale(len(mtse), convention=convention, unit=unit)
+        mtse *= scale
+        sd *= scale
+        return mtse, sd
 
     def _multitaper_cross_spectrum(self, clm, slm, k, convention='power',
                                    unit='per_l', clat=None, clon=None,
@@ -1597,25 +1770,10 @@ class SHWindowCap(SHWindow):
                                                 lmax1=lmax, lmax2=lmax, k=k,
                                                 taper_wt=weights)
 
-        if (unit == 'per_l'):
-            pass
-        elif (unit == 'per_lm'):
-            degree_l = _np.arange(len(mtse))
-            mtse /= (2.0 * degree_l + 1.0)
-            sd /= (2.0 * degree_l + 1.0)
-        else:
-            raise ValueError(
-                "unit must be 'per_l' or 'per_lm'." +
-                "Input value is {:s}.".format(repr(unit)))
-
-        if (convention == 'power'):
-            return mtse, sd
-        elif (convention == 'energy'):
-            return mtse * 4.0 * _np.pi, sd * 4.0 * _np.pi
-        else:
-            raise ValueError(
-                "convention must be 'power' or 'energy'." +
-                "Input value is {:s}.".format(repr(convention)))
+        scale = _multitaper_scale(len(mtse), convention=convention, unit=unit)
+        mtse *= scale
+        sd *= scale
+        return mtse, sd
 
     def _biased_spectrum(self, spectrum, k, convention='power', unit='per_l',
                          weights=None, save_cg=None, ldata=None):
@@ -1725,6 +1883,7 @@ class SHWindowMask(SHWindow):
         self.lwin = _np.sqrt(tapers.shape[0]).astype(int) - 1
         self.nwin = tapers.shape[1]
         self.taper_degrees = taper_degrees
+        self._grid_cache = {}
 
         if copy:
             self.weights = weights
@@ -1747,21 +1906,21 @@ class SHWindowMask(SHWindow):
         Return the spherical harmonic coefficients of taper i as an
         array, where i=0 is the best concentrated.
         """
-        coeffs = _shtools.SHVectorToCilm(self.tapers[:, itaper])
+        coeffs = _vector_to_cilm(self.tapers[:, itaper], self.lwin)
 
-        if normalization == 'schmidt':
-            for l in range(self.lwin + 1):
-                coeffs[:, l, :l+1] *= _np.sqrt(2.0 * l + 1.0)
-        elif normalization == 'ortho':
-            coeffs *= _np.sqrt(4.0 * _np.pi)
-
-        if csphase == -1:
-            for m in range(self.lwin + 1):
-                if m % 2 == 1:
-                    coeffs[:, :, m] = - coeffs[:, :, m]
+        factor = _to_array_factor(self.lwin, normalization, csphase)
+        if factor is not None:
+            coeffs *= factor
 
         return coeffs
 
+    def _power_stack(self, nwin):
+        """
+        Return the sum of the squares of the 4pi-normalized coefficients at
+        each degree for the first nwin tapers, with dimension (lwin+1, nwin).
+        """
+        return _vector_power(self.tapers[:, :nwin], self.lwin)
+
     def _coupling_matrix(self, lmax, k=None, weights=None):
         """Return the coupling matrix of the first nwin tapers."""
         if k is None:
@@ -1770,11 +1929,7 @@ class SHWindowMask(SHWindow):
         if weights is None:
             weights = self.weights
 
-        tapers_power = _np.zeros((self.lwin+1, k))
-        for i in range(k):
-            tapers_power[:, i] = _spectrum(self.to_array(i),
-                                           normalization='4pi',
-                                           convention='power', unit='per_l')
+        tapers_power = self.spectra(nwin=k, convention='power', unit='per_l')
 
         return _shtools.SHMTCouplingMatrix(lmax, tapers_power, k=k,
                                            taper_wt=weights)
@@ -1797,25 +1952,10 @@ class SHWindowMask(SHWindow):
         mtse, sd = _shtools.SHMultiTaperMaskSE(sh, self.tapers, lmax=lmax,
                                                k=k, taper_wt=weights)
 
-        if (unit == 'per_l'):
-            pass
-        elif (unit == 'per_lm'):
-            degree_l = _np.arange(len(mtse))
-            mtse /= (2.0 * degree_l + 1.0)
-            sd /= (2.0 * degree_l + 1.0)
-        else:
-            raise ValueError(
-                "unit must be 'per_l' or 'per_lm'." +
-                "Input value is {:s}.".format(repr(unit)))
-
-        if (convention == 'power'):
-            return mtse, sd
-        elif (convention == 'energy'):
-            return mtse * 4.0 * _np.pi, sd * 4.0 * _np.pi
-        else:
-            raise ValueError(
-                "convention must be 'power' or 'energy'." +
-                "Input value is {:s}.".format(repr(convention)))
+        scale = _multitaper_scale(len(mtse), convention=convention, unit=unit)
+        mtse *= scale
+        sd *= scale
+        return mtse, sd
 
     def _multitaper_cross_spectrum(self, clm, slm, k, convention='power',
                                    unit='per_l', lmax=None, weights=None,
@@ -1837,25 +1977,10 @@ class SHWindowMask(SHWindow):
                                                 lmax=lmax, k=k,
                                                 taper_wt=weights)
 
-        if (unit == 'per_l'):
-            pass
-        elif (unit == 'per_lm'):
-            degree_l = _np.arange(len(mtse))
-            mtse /= (2.0 * degree_l + 1.0)
-            sd /= (2.0 * degree_l + 1.0)
-        else:
-            raise ValueError(
-                "unit must be 'per_l' or 'per_lm'." +
-                "Input value is {:s}.".format(repr(unit)))
-
-        if (convention == 'power'):
-            return mtse, sd
-        elif (convention == 'energy'):
-            return mtse * 4.0 * _np.pi, sd * 4.0 * _np.pi
-        else:
-            raise ValueError(
-                "convention must be 'power' or 'energy'." +
-                "Input value is {:s}.".format(repr(convention)))
+        scale = _multitaper_scale(len(mtse), convention=convention, unit=unit)
+        mtse *= scale
+        sd *= scale
+        return mtse, sd
 
     def _biased_spectrum(self, spectrum, k, convention='power', unit='per_l',
                          weights=None, save_cg=None, ldata=None):
@@ -78,10 +78,17 @@ def get_version():
                   'Setting to x.x')
             git_version = 'x.x'
 
-        # PEP440 compatibility
+        # PEP440 compatibility. Untagged commits are described as
+        # tag-ncommits-gREVISION, so the abbreviated revision can be taken
+        # from the output of git describe without calling git again. A
+        # hyphenated tag at HEAD has no such suffix, so ask git for HEAD.
         if '-' in git_version:
-            git_revision = check_output(['git', 'rev-parse', 'HEAD'])
-            git_revision = git_revision.strip().decode('ascii')
+            match = re.search(r'-\d+-g([0-9a-f]+)$', git_version)
+            if match:
+                git_revision = match.group(1)
+            else:
+                git_revision = check_output(['git', 'rev-parse', 'HEAD'])
+                git_revision = git_revision.strip().decode('ascii')
             # add post0 if the version is released
             # otherwise add dev0 if the version is not yet released
             if ISRELEASED:
@@ -222,8 +229,17 @@ def configuration(parent_package='', top_path=None):
     libdir = os.path.join('build', build_lib_dir.format(**dirparams))
     print('searching SHTOOLS in:', libdir)
 
+    # Optional host-specific optimization of the Fortran library. These flags
+    # produce binaries that may not run on other machines, and are thus only
+    # used when PYSHTOOLS_NATIVE=1 is set.
+    extra_f90_compile_args = []
+    if (os.environ.get('PYSHTOOLS_NATIVE') == '1' and
+            get_default_fcompiler() == 'gnu95'):
+        extra_f90_compile_args.extend(['-march=native', '-funroll-loops'])
+
     # Fortran compilation
-    config.add_library('SHTOOLS', sources=sources)
+    config.add_library('SHTOOLS', sources=sources,
+                       extra_f90_compile_args=extra_f90_compile_args)
 
     # SHTOOLS
     kwargs['libraries'].extend(['SHTOOLS'])